@@ -20,13 +20,101 @@ Target: Indonesian Students
 """
 
 import requests
-import json
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import orjson
 import time
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import LXMLTreeBuilder
 from datetime import datetime
 import urllib.parse
 import csv
+import functools
+import io
+import os
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+# One shared session so every example reuses pooled keep-alive connections
+# instead of paying a new TCP+TLS handshake per request
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# Session for the robust scraper: urllib3 retries failed GETs with exponential
+# backoff (honouring Retry-After on 429) while reusing pooled connections.
+# Read timeouts are not retried so they still surface as requests' Timeout
+RETRY_POLICY = Retry(
+    total=3,
+    read=False,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(['GET']),
+)
+SCRAPER_SESSION = requests.Session()
+SCRAPER_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=RETRY_POLICY)
+SCRAPER_SESSION.mount('https://', SCRAPER_ADAPTER)
+SCRAPER_SESSION.mount('http://', SCRAPER_ADAPTER)
+SCRAPER_SESSION.headers.update({
+    'User-Agent': 'Indonesian-Educational-Bot/1.0'
+})
+
+# Cached session for stable API resources: stores ETag/Last-Modified and
+# revalidates with If-None-Match/If-Modified-Since, so a 304 reuses the body
+CACHED_SESSION = requests_cache.CachedSession(
+    'indonesian_api_cache', backend='sqlite', cache_control=True
+)
+
+# Header sets shared by every scraper session instead of rebuilt per instance
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'id-ID,id;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+BOT_HEADERS = {
+    'User-Agent': 'Indonesian-Student-Bot/1.0 (Educational Purpose)'
+}
+
+# lxml parses in C and is much faster than the pure-Python 'html.parser';
+# binding the builder class up front also skips the parser-registry lookup
+make_soup = functools.partial(BeautifulSoup, builder=LXMLTreeBuilder)
+
+def compute_sleep(last_request_time, now, delay):
+    """Seconds to wait so requests are at least `delay` seconds apart"""
+    return max(0.0, delay - (now - last_request_time))
+
+def backoff(attempt):
+    """Exponential backoff delay in seconds for a zero-based retry attempt"""
+    return 2.0 ** attempt
+
+def print_table(df):
+    """Print a DataFrame as tab-separated rows through pandas' C CSV writer"""
+    df.to_csv(sys.stdout, sep='\t', index=False, float_format='%.2f')
+
+# Reused across calls so repeated CSV exports don't allocate a new buffer
+CSV_BUFFER = io.BytesIO()
+
+def render_csv(df):
+    """Render a DataFrame as UTF-8 CSV into CSV_BUFFER and return a zero-copy view"""
+    # Use the view in a `with` block: the buffer cannot be resized by the
+    # next call while a view of it is still alive
+    CSV_BUFFER.seek(0)
+    CSV_BUFFER.truncate()
+    df.to_csv(CSV_BUFFER, index=False, encoding='utf-8')
+    return CSV_BUFFER.getbuffer()
+
+def write_payloads(payloads):
+    """Write pre-serialized {path: bytes-like} payloads, one large write per file"""
+    for path, payload in payloads.items():
+        with open(path, 'wb', buffering=1 << 20) as f:
+            f.write(payload)
 
 print("🇮🇩 STEP-BY-STEP GUIDE: WEB SCRAPING AND API")
 print("=" * 60)
@@ -48,10 +136,11 @@ def step1_basic_http_requests():
     # Example 1: Simple GET request
     print("\n1.1 Simple GET Request to Indonesian website")
     try:
-        response = requests.get('https://httpbin.org/get')
+        response = SESSION.get('https://httpbin.org/get')
         print(f"✅ Status Code: {response.status_code}")
-        print(f"✅ Response Type: {type(response.json())}")
-        print(f"✅ Sample Data: {list(response.json().keys())}")
+        data = orjson.loads(response.content)
+        print(f"✅ Response Type: {type(data)}")
+        print(f"✅ Sample Data: {list(data.keys())}")
     except Exception as e:
         print(f"❌ Error: {e}")
     
@@ -64,9 +153,9 @@ def step1_basic_http_requests():
     }
     
     try:
-        response = requests.get('https://httpbin.org/headers', headers=headers)
+        response = SESSION.get('https://httpbin.org/headers', headers=headers)
         print(f"✅ Headers sent successfully: {response.status_code}")
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"✅ User-Agent detected: {data['headers'].get('User-Agent', 'N/A')}")
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -80,9 +169,9 @@ def step1_basic_http_requests():
     }
     
     try:
-        response = requests.get('https://httpbin.org/get', params=params)
+        response = SESSION.get('https://httpbin.org/get', params=params)
         print(f"✅ Parameters sent successfully: {response.status_code}")
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"✅ Final URL: {data['url']}")
         print(f"✅ Parameters: {data['args']}")
     except Exception as e:
@@ -112,9 +201,10 @@ def step2_working_with_apis():
     print("\n2.1 Accessing Indonesian Region API")
     try:
         # Free API for Indonesian region data
-        response = requests.get('https://www.emsifa.com/api-wilayah-indonesia/api/provinces.json')
+        url = 'https://www.emsifa.com/api-wilayah-indonesia/api/provinces.json'
+        response = CACHED_SESSION.get(url)
         if response.status_code == 200:
-            provinces = response.json()
+            provinces = orjson.loads(response.content)
             print(f"✅ Successfully retrieved data for {len(provinces)} provinces")
             print("✅ First 5 provinces:")
             for i, province in enumerate(provinces[:5]):
@@ -145,13 +235,13 @@ def step2_working_with_apis():
     
     # Example 3: API with Error Handling
     print("\n2.3 Error Handling for API Calls")
-    def safe_api_call(url, max_retries=3):
+    def safe_api_call(url, max_retries=3, session=SESSION):
         """API call with retry mechanism"""
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, timeout=10)
+                response = session.get(url, timeout=10)
                 if response.status_code == 200:
-                    return response.json()
+                    return orjson.loads(response.content)
                 else:
                     print(f"⚠️ Attempt {attempt + 1}: Status {response.status_code}")
             except requests.exceptions.Timeout:
@@ -160,7 +250,7 @@ def step2_working_with_apis():
                 print(f"⚠️ Attempt {attempt + 1}: Connection Error")
             
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                time.sleep(backoff(attempt))  # Exponential backoff
         
         return None
     
@@ -184,6 +274,25 @@ def step2_working_with_apis():
 print("\n📚 STEP 3: INTRODUCTION TO WEB SCRAPING")
 print("-" * 40)
 
+# Simulated quote data
+SIMULATED_QUOTES = tuple(map(MappingProxyType, [
+    {
+        "text": "Independence can only be maintained by a free people",
+        "author": "Soekarno",
+        "tags": ("independence", "freedom", "indonesia")
+    },
+    {
+        "text": "A great nation is one that honors the services of its heroes",
+        "author": "Soekarno", 
+        "tags": ("nation", "heroes", "history")
+    },
+    {
+        "text": "Never abandon history",
+        "author": "Soekarno",
+        "tags": ("history", "learning", "future")
+    }
+]))
+
 def step3_web_scraping_basics():
     """
     Step 3: Web scraping basics with BeautifulSoup
@@ -214,7 +323,9 @@ def step3_web_scraping_basics():
     </html>
     """
     
-    soup = BeautifulSoup(sample_html, 'html.parser')
+    # Only build the parts of the page we need: the title and the articles
+    page_strainer = SoupStrainer(['title', 'article'])
+    soup = make_soup(sample_html, parse_only=page_strainer)
     
     # Extract title
     title = soup.find('title').text
@@ -250,24 +361,7 @@ def step3_web_scraping_basics():
     
     def scrape_quotes_simulation():
         """Quote scraping simulation for learning"""
-        quotes_data = [
-            {
-                "text": "Independence can only be maintained by a free people",
-                "author": "Soekarno",
-                "tags": ["independence", "freedom", "indonesia"]
-            },
-            {
-                "text": "A great nation is one that honors the services of its heroes",
-                "author": "Soekarno", 
-                "tags": ["nation", "heroes", "history"]
-            },
-            {
-                "text": "Never abandon history",
-                "author": "Soekarno",
-                "tags": ["history", "learning", "future"]
-            }
-        ]
-        return quotes_data
+        return SIMULATED_QUOTES
     
     quotes = scrape_quotes_simulation()
     print(f"✅ Successfully scraped {len(quotes)} quotes:")
@@ -277,6 +371,7 @@ def step3_web_scraping_basics():
     
     print("\n💡 Key Learning Points:")
     print("- BeautifulSoup simplifies HTML parsing")
+    print("- Use the lxml parser and SoupStrainer to parse only what you need")
     print("- find() for single element, find_all() for multiple elements")
     print("- CSS selectors provide flexibility in element selection")
     print("- Always inspect HTML structure before scraping")
@@ -288,6 +383,24 @@ def step3_web_scraping_basics():
 print("\n📚 STEP 4: ADVANCED SCRAPING TECHNIQUES")
 print("-" * 40)
 
+# Simulated product data
+SIMULATED_PRODUCTS = tuple(map(MappingProxyType, [
+    {
+        'name': 'Smartphone Samsung Galaxy A54',
+        'price': 'Rp 5.999.000',
+        'rating': 4.5,
+        'sold': 1250,
+        'location': 'Jakarta Barat'
+    },
+    {
+        'name': 'Nike Air Max Shoes',
+        'price': 'Rp 1.899.000', 
+        'rating': 4.7,
+        'sold': 890,
+        'location': 'Bandung'
+    }
+]))
+
 def step4_advanced_scraping():
     """
     Step 4: Advanced scraping techniques for Indonesian websites
@@ -298,13 +411,7 @@ def step4_advanced_scraping():
     # Example 1: Using Sessions
     print("\n4.1 Using Sessions for Scraping")
     session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'id-ID,id;q=0.8,en-US;q=0.5,en;q=0.3',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-    })
+    session.headers.update(BROWSER_HEADERS)
     
     print("✅ Session created with Indonesian-friendly headers")
     print(f"✅ User-Agent: {session.headers['User-Agent'][:50]}...")
@@ -317,17 +424,13 @@ def step4_advanced_scraping():
             self.delay = delay
             self.last_request_time = 0
             self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': 'Indonesian-Student-Bot/1.0 (Educational Purpose)'
-            })
+            self.session.headers.update(BOT_HEADERS)
         
         def polite_get(self, url):
             """GET request with rate limiting"""
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
+            sleep_time = compute_sleep(self.last_request_time, time.time(), self.delay)
             
-            if time_since_last < self.delay:
-                sleep_time = self.delay - time_since_last
+            if sleep_time > 0:
                 print(f"⏳ Waiting {sleep_time:.1f} seconds for politeness...")
                 time.sleep(sleep_time)
             
@@ -347,27 +450,11 @@ def step4_advanced_scraping():
     
     def extract_indonesian_ecommerce_data(html_content):
         """Indonesian e-commerce data extraction simulation"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        product_strainer = SoupStrainer('div', class_='product-card')
+        soup = make_soup(html_content, parse_only=product_strainer)
         
         # Product data simulation
-        products = [
-            {
-                'name': 'Smartphone Samsung Galaxy A54',
-                'price': 'Rp 5.999.000',
-                'rating': 4.5,
-                'sold': 1250,
-                'location': 'Jakarta Barat'
-            },
-            {
-                'name': 'Nike Air Max Shoes',
-                'price': 'Rp 1.899.000', 
-                'rating': 4.7,
-                'sold': 890,
-                'location': 'Bandung'
-            }
-        ]
-        
-        return products
+        return SIMULATED_PRODUCTS
     
     # E-commerce HTML simulation
     sample_ecommerce_html = "<html><body>Sample e-commerce page</body></html>"
@@ -392,6 +479,9 @@ def step4_advanced_scraping():
 print("\n📚 STEP 5: DATA PROCESSING AND STORAGE")
 print("-" * 40)
 
+# Translation table that deletes ',' and '.' thousands separators in one pass
+DELETE_SEPARATORS = str.maketrans('', '', ',.')
+
 def step5_data_processing():
     """
     Step 5: Processing and storing collected Indonesian data
@@ -412,48 +502,39 @@ def step5_data_processing():
     ]
     
     def clean_indonesian_city_data(data):
-        """Clean Indonesian city data"""
-        cleaned_data = []
+        """Clean Indonesian city data into a DataFrame"""
+        df = pd.DataFrame(data).reindex(columns=['city', 'population', 'province'])
         
-        for item in data:
-            # Skip empty data
-            if not item['city'] or item['city'].strip() == '':
-                continue
-                
-            # Clean city name
-            city = item['city'].strip().title()
-            
-            # Clean population (remove commas, dots, convert to int)
-            pop_str = item['population'].replace(',', '').replace('.', '')
-            try:
-                population = int(pop_str) if pop_str.isdigit() else 0
-            except:
-                population = 0
-            
-            # Clean province name
-            province = item['province'].strip().title()
-            
-            if population > 0:  # Only include valid data
-                cleaned_data.append({
-                    'city': city,
-                    'population': population,
-                    'province': province
-                })
+        # Skip empty data
+        df = df[df['city'].fillna('').astype(str).str.strip() != '']
+        
+        # Clean population (remove commas, dots); keep plain digit strings only
+        pop_str = df['population'].astype(str).str.translate(DELETE_SEPARATORS)
+        digits = pop_str.str.fullmatch(r'\d+')
+        df = df[digits].copy()
+        df['population'] = pop_str[digits].astype('int64')
+        
+        # Clean city and province names
+        df['city'] = df['city'].astype(str).str.strip().str.title()
+        df['province'] = df['province'].fillna('').astype(str).str.strip().str.title()
         
-        return cleaned_data
+        # Only include valid data
+        df = df[df['population'] > 0]
+        
+        return df[['city', 'population', 'province']].reset_index(drop=True)
     
     cleaned_cities = clean_indonesian_city_data(raw_indonesian_data)
     print(f"✅ Data cleaned: {len(raw_indonesian_data)} → {len(cleaned_cities)} records")
     
-    for city in cleaned_cities:
-        print(f"   🏙️ {city['city']}: {city['population']:,} people ({city['province']})")
+    for city in cleaned_cities.itertuples(index=False):
+        print(f"   🏙️ {city.city}: {city.population:,} people ({city.province})")
     
     # Example 2: Using Pandas for analysis
     print("\n5.2 Data Analysis with Pandas")
     
-    df = pd.DataFrame(cleaned_cities)
+    df = cleaned_cities  # Already a DataFrame, no need to rebuild it
     print("✅ DataFrame created:")
-    print(df.to_string(index=False))
+    print_table(df)
     
     # Basic statistics
     print(f"\n📊 Population Statistics:")
@@ -464,13 +545,16 @@ def step5_data_processing():
     # Example 3: Saving data in various formats
     print("\n5.3 Saving Data in Various Formats")
     
-    # Save as CSV
-    df.to_csv('indonesian_cities.csv', index=False, encoding='utf-8')
-    print("✅ Data saved as CSV: indonesian_cities.csv")
+    # Serialize every format in memory first, then write them back-to-back
+    json_bytes = orjson.dumps(df.to_dict('records'), option=orjson.OPT_INDENT_2)
     
-    # Save as JSON
-    with open('indonesian_cities.json', 'w', encoding='utf-8') as f:
-        json.dump(cleaned_cities, f, ensure_ascii=False, indent=2)
+    # Save as CSV and JSON
+    with render_csv(df) as csv_view:
+        write_payloads({
+            'indonesian_cities.csv': csv_view,
+            'indonesian_cities.json': json_bytes,
+        })
+    print("✅ Data saved as CSV: indonesian_cities.csv")
     print("✅ Data saved as JSON: indonesian_cities.json")
     
     # Save as Excel (if openpyxl is available)
@@ -493,6 +577,19 @@ def step5_data_processing():
 print("\n📚 STEP 6: ERROR HANDLING AND BEST PRACTICES")
 print("-" * 40)
 
+# Valid Indonesian provinces; a frozenset gives O(1) membership checks
+VALID_PROVINCES = frozenset([
+    'Aceh', 'Sumatera Utara', 'Sumatera Barat', 'Riau', 'Jambi',
+    'Sumatera Selatan', 'Bengkulu', 'Lampung', 'Kepulauan Bangka Belitung',
+    'Kepulauan Riau', 'DKI Jakarta', 'Jawa Barat', 'Jawa Tengah',
+    'DI Yogyakarta', 'Jawa Timur', 'Banten', 'Bali', 'Nusa Tenggara Barat',
+    'Nusa Tenggara Timur', 'Kalimantan Barat', 'Kalimantan Tengah',
+    'Kalimantan Selatan', 'Kalimantan Timur', 'Kalimantan Utara',
+    'Sulawesi Utara', 'Sulawesi Tengah', 'Sulawesi Selatan',
+    'Sulawesi Tenggara', 'Gorontalo', 'Sulawesi Barat', 'Maluku',
+    'Maluku Utara', 'Papua Barat', 'Papua'
+])
+
 def step6_error_handling():
     """
     Step 6: Implementing error handling and best practices
@@ -504,80 +601,124 @@ def step6_error_handling():
     print("\n6.1 Comprehensive Error Handling")
     
     class RobustIndonesianScraper:
-        def __init__(self):
-            self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': 'Indonesian-Educational-Bot/1.0'
-            })
+        # Message templates for the (kind, url, detail) tuples in self.errors
+        ERROR_MESSAGES = {
+            'not_found': "404 error for {url}",
+            'status': "Status {detail} for {url}",
+            'retries_exhausted': "Retries exhausted for {url}",
+            'timeout': "Timeout for {url}",
+            'connection': "Connection error for {url}",
+            'unexpected': "Unexpected error for {url}: {detail}",
+        }
+        
+        def __init__(self, cache_size=128):
+            # Shared pooled session; urllib3 handles retries and backoff
+            self.session = SCRAPER_SESSION
             self.errors = []
+            self._lock = threading.Lock()
+            # Successful responses by URL, least recently used first
+            self._response_cache = OrderedDict()
+            self._cache_size = cache_size
+        
+        def _record_error(self, kind, url, detail=None):
+            """Log an error as a raw tuple; safe to call from worker threads"""
+            # Messages are only formatted when get_error_summary() is called
+            with self._lock:
+                self.errors.append((kind, url, detail))
+        
+        def _get_cached(self, url):
+            """Return the cached response for url, or None"""
+            with self._lock:
+                response = self._response_cache.get(url)
+                if response is not None:
+                    self._response_cache.move_to_end(url)
+                return response
+        
+        def _cache_response(self, url, response):
+            """Cache a successful response, evicting the least recently used one"""
+            with self._lock:
+                self._response_cache[url] = response
+                self._response_cache.move_to_end(url)
+                if len(self._response_cache) > self._cache_size:
+                    self._response_cache.popitem(last=False)
+        
+        def scrape_many(self, urls, max_workers=16):
+            """Scrape several URLs concurrently, returning results in input order"""
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(self.scrape_with_error_handling, urls))
         
-        def scrape_with_error_handling(self, url, max_retries=3):
+        def scrape_with_error_handling(self, url):
             """Scraping with comprehensive error handling"""
-            for attempt in range(max_retries):
-                try:
-                    print(f"🔄 Attempt {attempt + 1} for {url}")
-                    
-                    response = self.session.get(url, timeout=10)
-                    
-                    if response.status_code == 200:
-                        print(f"✅ Successfully accessed {url}")
-                        return response
-                    
-                    elif response.status_code == 429:
-                        print("⚠️ Rate limited, waiting longer...")
-                        time.sleep(60)  # Wait 1 minute for rate limit
-                        continue
-                    
-                    elif response.status_code == 404:
-                        print("❌ Page not found (404)")
-                        self.errors.append(f"404 error for {url}")
-                        return None
-                    
-                    else:
-                        print(f"⚠️ Unexpected status code: {response.status_code}")
-                        
-                except requests.exceptions.Timeout:
-                    print(f"⏰ Timeout on attempt {attempt + 1}")
-                    self.errors.append(f"Timeout for {url} on attempt {attempt + 1}")
-                    
-                except requests.exceptions.ConnectionError:
-                    print(f"🔌 Connection error on attempt {attempt + 1}")
-                    self.errors.append(f"Connection error for {url} on attempt {attempt + 1}")
+            cached = self._get_cached(url)
+            if cached is not None:
+                print(f"♻️ Using cached response for {url}")
+                return cached
+            
+            retries = self.session.get_adapter(url).max_retries.total
+            print(f"🔄 Requesting {url} (up to {retries} retries)")
+            
+            try:
+                response = self.session.get(url, timeout=10)
+                
+                if response.status_code == 200:
+                    print(f"✅ Successfully accessed {url}")
+                    self._cache_response(url, response)
+                    return response
+                
+                elif response.status_code == 404:
+                    print("❌ Page not found (404)")
+                    self._record_error('not_found', url)
+                    return None
+                
+                else:
+                    print(f"⚠️ Unexpected status code: {response.status_code}")
+                    self._record_error('status', url, response.status_code)
                     
-                except Exception as e:
-                    print(f"❌ Unexpected error: {str(e)}")
-                    self.errors.append(f"Unexpected error for {url}: {str(e)}")
+            except requests.exceptions.RetryError:
+                print("⚠️ Still rate limited or failing after all retries")
+                self._record_error('retries_exhausted', url)
+                
+            except requests.exceptions.Timeout:
+                print("⏰ Timeout")
+                self._record_error('timeout', url)
+                
+            except requests.exceptions.ConnectionError:
+                print("🔌 Connection error after all retries")
+                self._record_error('connection', url)
                 
-                # Exponential backoff
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"⏳ Waiting {wait_time} seconds before retry...")
-                    time.sleep(wait_time)
+            except Exception as e:
+                print(f"❌ Unexpected error: {str(e)}")
+                # repr() rather than the exception, whose traceback would keep self alive
+                self._record_error('unexpected', url, repr(e))
             
-            print(f"❌ Failed to access {url} after {max_retries} attempts")
+            print(f"❌ Failed to access {url}")
             return None
         
         def get_error_summary(self):
             """Get error summary"""
+            with self._lock:
+                errors = list(self.errors)
             return {
-                'total_errors': len(self.errors),
-                'errors': self.errors
+                'total_errors': len(errors),
+                'errors': [
+                    self.ERROR_MESSAGES[kind].format(url=url, detail=detail)
+                    for kind, url, detail in errors
+                ]
             }
     
     # Test robust scraper
     scraper = RobustIndonesianScraper()
     
-    # Test with valid URL
-    result = scraper.scrape_with_error_handling('https://httpbin.org/status/200')
-    
-    # Test with URL that will timeout
-    result = scraper.scrape_with_error_handling('https://httpbin.org/delay/15')
+    # Test a valid URL and one that will timeout, concurrently
+    results = scraper.scrape_many([
+        'https://httpbin.org/status/200',
+        'https://httpbin.org/delay/15',
+    ])
     
     # Print error summary
     error_summary = scraper.get_error_summary()
     print(f"\n📋 Error Summary: {error_summary['total_errors']} errors")
-    for error in error_summary['errors']:
-        print(f"   ❌ {error}")
+    sys.stdout.write(''.join(f"   ❌ {error}\n" for error in error_summary['errors']))
     
     # Example 2: Data Validation
     print("\n6.2 Indonesian Data Validation")
@@ -585,32 +726,25 @@ def step6_error_handling():
     def validate_indonesian_data(data):
         """Validate Indonesian data"""
         validation_errors = []
+        # dtype=object keeps the original Python values so types can be checked
+        vdf = pd.DataFrame(data, dtype=object).reindex(columns=['city', 'population', 'province'])
         
-        # List of valid Indonesian provinces
-        valid_provinces = [
-            'Aceh', 'Sumatera Utara', 'Sumatera Barat', 'Riau', 'Jambi',
-            'Sumatera Selatan', 'Bengkulu', 'Lampung', 'Kepulauan Bangka Belitung',
-            'Kepulauan Riau', 'DKI Jakarta', 'Jawa Barat', 'Jawa Tengah',
-            'DI Yogyakarta', 'Jawa Timur', 'Banten', 'Bali', 'Nusa Tenggara Barat',
-            'Nusa Tenggara Timur', 'Kalimantan Barat', 'Kalimantan Tengah',
-            'Kalimantan Selatan', 'Kalimantan Timur', 'Kalimantan Utara',
-            'Sulawesi Utara', 'Sulawesi Tengah', 'Sulawesi Selatan',
-            'Sulawesi Tenggara', 'Gorontalo', 'Sulawesi Barat', 'Maluku',
-            'Maluku Utara', 'Papua Barat', 'Papua'
-        ]
+        # Check every row at once with boolean masks
+        invalid_city = vdf['city'].fillna('').astype(str).str.len() < 2
+        is_int = vdf['population'].map(type).isin([int, bool])
+        population = pd.to_numeric(vdf['population'].where(is_int), errors='coerce')
+        invalid_population = ~(is_int & (population >= 0))
+        invalid_province = ~vdf['province'].isin(VALID_PROVINCES)
         
-        for i, item in enumerate(data):
-            # Validate city name
-            if not item.get('city') or len(item['city']) < 2:
+        # Only build messages for the rows that failed a check
+        failed = invalid_city | invalid_population | invalid_province
+        for i in vdf.index[failed]:
+            if invalid_city[i]:
                 validation_errors.append(f"Row {i}: Invalid city name")
-            
-            # Validate population
-            if not isinstance(item.get('population'), int) or item['population'] < 0:
+            if invalid_population[i]:
                 validation_errors.append(f"Row {i}: Invalid population")
-            
-            # Validate province
-            if item.get('province') not in valid_provinces:
-                validation_errors.append(f"Row {i}: Invalid province '{item.get('province')}'")
+            if invalid_province[i]:
+                validation_errors.append(f"Row {i}: Invalid province '{data[i].get('province')}'")
         
         return validation_errors
     
@@ -623,8 +757,7 @@ def step6_error_handling():
     
     errors = validate_indonesian_data(test_data)
     print(f"✅ Validation complete: {len(errors)} errors found")
-    for error in errors:
-        print(f"   ❌ {error}")
+    sys.stdout.write(''.join(f"   ❌ {error}\n" for error in errors))
     
     print("\n💡 Key Learning Points:")
     print("- Always implement comprehensive error handling")
@@ -639,6 +772,39 @@ def step6_error_handling():
 print("\n📚 STEP 7: COMBINING MULTIPLE DATA SOURCES")
 print("-" * 40)
 
+# Additional data sources (simulated)
+ECONOMIC_DATA = {
+    'Jakarta': {'gdp_per_capita': 15000, 'unemployment_rate': 5.2},
+    'Surabaya': {'gdp_per_capita': 12000, 'unemployment_rate': 4.8},
+    'Bandung': {'gdp_per_capita': 10000, 'unemployment_rate': 6.1}
+}
+
+TOURISM_DATA = {
+    'Jakarta': {'tourist_attractions': 25, 'hotels': 450},
+    'Surabaya': {'tourist_attractions': 18, 'hotels': 280},
+    'Bandung': {'tourist_attractions': 30, 'hotels': 320}
+}
+
+def build_city_enrichment(economic_data, tourism_data):
+    """Join the enrichment sources into one table keyed by city, with composite scores"""
+    enrichment = pd.DataFrame.from_dict(economic_data, orient='index').join(
+        pd.DataFrame.from_dict(tourism_data, orient='index'), how='outer'
+    )
+    enrichment.index.name = 'city'
+    
+    # Calculate composite scores for every city in one vectorized expression
+    enrichment['economic_score'] = (
+        (enrichment['gdp_per_capita'] / 1000) * (10 - enrichment['unemployment_rate'])
+    ).round(2)
+    
+    return enrichment
+
+# Enrichment fields that are whole numbers
+ENRICHMENT_INT_COLUMNS = ['gdp_per_capita', 'tourist_attractions', 'hotels']
+
+# Per-city enrichment table, so enriching records is a single columnar join
+CITY_ENRICHMENT = build_city_enrichment(ECONOMIC_DATA, TOURISM_DATA)
+
 def step7_combining_data_sources():
     """
     Step 7: Combining data from APIs and web scraping
@@ -653,7 +819,7 @@ def step7_combining_data_sources():
         def __init__(self):
             self.api_data = {}
             self.scraped_data = {}
-            self.integrated_data = {}
+            self.integrated_data = pd.DataFrame()
         
         def fetch_api_data(self):
             """Simulate fetching data from API"""
@@ -681,18 +847,34 @@ def step7_combining_data_sources():
         
         def integrate_data(self):
             """Combine data based on city name"""
-            # Convert to DataFrames for easier merging
-            weather_df = pd.DataFrame(self.api_data['weather'])
-            population_df = pd.DataFrame(self.scraped_data['population'])
+            # Index population records by city for O(1) lookups
+            population_by_city = {row['city']: row for row in self.scraped_data['population']}
             
-            # Merge data based on city
-            integrated_df = pd.merge(weather_df, population_df, on='city', how='inner')
+            # Inner join on city
+            joined = [
+                {**weather, **population_by_city[weather['city']]}
+                for weather in self.api_data['weather']
+                if weather['city'] in population_by_city
+            ]
+            # Explicit columns keep an empty join usable downstream
+            columns = list(dict.fromkeys(
+                key
+                for row in (*self.api_data['weather'], *self.scraped_data['population'])
+                for key in row
+            ))
+            integrated_df = pd.DataFrame(joined, columns=columns)
             
-            # Add calculated fields
-            integrated_df['population_density'] = integrated_df['population'] / integrated_df['area_km2']
-            integrated_df['comfort_index'] = (100 - integrated_df['humidity']) * 0.5 + (30 - abs(integrated_df['temperature'] - 25)) * 0.5
+            # Add calculated fields from the raw NumPy columns in one pass
+            population = integrated_df['population'].to_numpy()
+            area = integrated_df['area_km2'].to_numpy()
+            humidity = integrated_df['humidity'].to_numpy()
+            temperature = integrated_df['temperature'].to_numpy()
+            integrated_df['population_density'] = population / area
+            # (100 - humidity) * 0.5 + (30 - |temperature - 25|) * 0.5, folded
+            # into a single scale so NumPy makes fewer temporary arrays
+            integrated_df['comfort_index'] = 0.5 * (130 - humidity - np.abs(temperature - 25))
             
-            self.integrated_data = integrated_df.to_dict('records')
+            self.integrated_data = integrated_df
             print(f"✅ Data integrated: {len(self.integrated_data)} complete records")
             
             return integrated_df
@@ -704,72 +886,47 @@ def step7_combining_data_sources():
     df = integrator.integrate_data()
     
     print("\n📊 Integrated Data:")
-    print(df.to_string(index=False))
+    print_table(df)
     
     # Example 2: Data Enrichment
     print("\n7.2 Data Enrichment with Multiple Sources")
     
     def enrich_indonesian_city_data(base_data):
-        """Enrich city data with additional information"""
-        
-        # Additional data sources (simulated)
-        economic_data = {
-            'Jakarta': {'gdp_per_capita': 15000, 'unemployment_rate': 5.2},
-            'Surabaya': {'gdp_per_capita': 12000, 'unemployment_rate': 4.8},
-            'Bandung': {'gdp_per_capita': 10000, 'unemployment_rate': 6.1}
-        }
-        
-        tourism_data = {
-            'Jakarta': {'tourist_attractions': 25, 'hotels': 450},
-            'Surabaya': {'tourist_attractions': 18, 'hotels': 280},
-            'Bandung': {'tourist_attractions': 30, 'hotels': 320}
-        }
-        
-        enriched_data = []
-        
-        for city_data in base_data:
-            city_name = city_data['city']
-            
-            # Start with base data
-            enriched_record = city_data.copy()
-            
-            # Add economic data
-            if city_name in economic_data:
-                enriched_record.update(economic_data[city_name])
-            
-            # Add tourism data
-            if city_name in tourism_data:
-                enriched_record.update(tourism_data[city_name])
-            
-            # Calculate composite scores
-            if 'gdp_per_capita' in enriched_record and 'unemployment_rate' in enriched_record:
-                economic_score = (enriched_record['gdp_per_capita'] / 1000) * (10 - enriched_record['unemployment_rate'])
-                enriched_record['economic_score'] = round(economic_score, 2)
-            
-            enriched_data.append(enriched_record)
-        
-        return enriched_data
+        """Enrich a city DataFrame with additional information"""
+        # Left join keeps every base city; unknown cities get missing enrichment
+        enriched = base_data.join(CITY_ENRICHMENT, on='city')
+        # Nullable ints stop one unmatched city turning every count into a float
+        return enriched.astype({col: 'Int64' for col in ENRICHMENT_INT_COLUMNS})
     
     # Enrich the integrated data
     enriched_cities = enrich_indonesian_city_data(integrator.integrated_data)
+    # Records without the missing fields, so .get() falls back as before
+    enriched_records = [
+        {key: value for key, value in row.items() if pd.notna(value)}
+        for row in enriched_cities.to_dict('records')
+    ]
     
     print("✅ Data enriched with economic and tourism information:")
-    for city in enriched_cities:
+    for city in enriched_records:
+        gdp_per_capita = city.get('gdp_per_capita')
         print(f"\n🏙️ {city['city']}:")
         print(f"   👥 Population: {city['population']:,} people")
         print(f"   🌡️ Temperature: {city['temperature']}°C")
-        print(f"   💰 GDP per capita: ${city.get('gdp_per_capita', 'N/A'):,}")
+        print(f"   💰 GDP per capita: {'N/A' if gdp_per_capita is None else f'${gdp_per_capita:,}'}")
         print(f"   🏨 Hotels: {city.get('hotels', 'N/A')} units")
         print(f"   📊 Economic Score: {city.get('economic_score', 'N/A')}")
     
     # Example 3: Save Final Integrated Dataset
     print("\n7.3 Saving Final Dataset")
     
-    final_df = pd.DataFrame(enriched_cities)
+    final_df = enriched_cities
     
     # Save in multiple formats
-    final_df.to_csv('indonesian_cities_integrated.csv', index=False, encoding='utf-8')
-    final_df.to_json('indonesian_cities_integrated.json', orient='records', indent=2)
+    with render_csv(final_df) as csv_view:
+        write_payloads({
+            'indonesian_cities_integrated.csv': csv_view,
+            'indonesian_cities_integrated.json': orjson.dumps(enriched_records, option=orjson.OPT_INDENT_2),
+        })
     
     print("✅ Final dataset saved:")
     print("   📄 indonesian_cities_integrated.csv")
@@ -792,6 +949,11 @@ def step7_combining_data_sources():
 # MAIN EXECUTION - MENJALANKAN SEMUA STEPS
 # =============================================================================
 
+def pause(message):
+    """Wait for Enter between steps, but only in an interactive terminal"""
+    if sys.stdin.isatty() and not os.environ.get('PIPELINE_NONINTERACTIVE'):
+        input(message)
+
 def main():
     """
     Main function to run all learning steps
@@ -803,22 +965,22 @@ def main():
     try:
         # Execute all steps
         step1_basic_http_requests()
-        input("\n⏸️ Press Enter to continue to Step 2...")
+        pause("\n⏸️ Press Enter to continue to Step 2...")
         
         step2_working_with_apis()
-        input("\n⏸️ Press Enter to continue to Step 3...")
+        pause("\n⏸️ Press Enter to continue to Step 3...")
         
         step3_web_scraping_basics()
-        input("\n⏸️ Press Enter to continue to Step 4...")
+        pause("\n⏸️ Press Enter to continue to Step 4...")
         
         step4_advanced_scraping()
-        input("\n⏸️ Press Enter to continue to Step 5...")
+        pause("\n⏸️ Press Enter to continue to Step 5...")
         
         step5_data_processing()
-        input("\n⏸️ Press Enter to continue to Step 6...")
+        pause("\n⏸️ Press Enter to continue to Step 6...")
         
         step6_error_handling()
-        input("\n⏸️ Press Enter to continue to Step 7...")
+        pause("\n⏸️ Press Enter to continue to Step 7...")
         
         step7_combining_data_sources()
         